@@ -14,17 +14,20 @@ Usage:
 
 import json
 import math
+from array import array
 import os
 import signal
-import socketserver
 import subprocess
 import sys
 import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 import cv2
 import rclpy
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
+from rclpy.executors import MultiThreadedExecutor
 from rclpy.node import Node
 from geometry_msgs.msg import Twist, TwistStamped, PoseStamped
 from nav_msgs.msg import Odometry
@@ -36,9 +39,20 @@ from cone_detector import (
     FRAME_WIDTH, FRAME_HEIGHT, CAMERA_DFOV_DEG,
 )
 
+# orjson encodes/decodes the small HTTP payloads several times faster;
+# fall back to stdlib json when it isn't installed.
+try:
+    import orjson
 
-class ThreadedHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
-    daemon_threads = True
+    def json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(data):
+        return json.dumps(data).encode()
+
+    json_loads = json.loads
 
 PORT = 8888
 
@@ -49,6 +63,8 @@ GOAL_TOLERANCE = 0.08     # meters - how close is "arrived" (fused)
 UWB_VERIFY_TOLERANCE = 0.10  # meters - UWB verification after reaching goal
 UWB_VERIFY_MAX_RETRIES = 2   # max re-navigation attempts for UWB verification
 ANGLE_TOLERANCE = 0.1     # radians - how aligned before driving forward
+NAV_RATE = 0.05           # seconds - navigation controller timer period (20Hz)
+CMD_VEL_PERIOD = 0.05     # seconds - coalesced manual /cmd_vel publish period (20Hz)
 CALIBRATION_DRIVE_DIST = 0.5  # meters to drive during calibration
 
 # Obstacle avoidance parameters (distances in cm)
@@ -69,8 +85,12 @@ BOUNDARY_SLOW_MARGIN = 0.20  # start slowing 20cm from boundary
 MECHANISM_OFFSET_FORWARD = 0.19  # meters — mechanism is this far forward of UWB tag
 MECHANISM_OFFSET_LATERAL = 0.00  # meters — no lateral offset
 
+# Index layout of ConeBridgeNode.odom_pose
+ODOM_X, ODOM_Y, ODOM_YAW = 0, 1, 2
+
 # EV3 cone mechanism server
 EV3_MECHANISM_URL = os.environ.get('EV3_URL', 'http://172.20.10.2:8080')
+EV3_STATUS_CACHE_SEC = 1.0   # /status reuses the last EV3 probe for this long
 
 
 class ConeBridgeNode(Node):
@@ -79,10 +99,26 @@ class ConeBridgeNode(Node):
         self.cmd_vel_pub = self.create_publisher(TwistStamped, '/cmd_vel', 10)
         self.sound_pub = self.create_publisher(Sound, '/sound', 10)
 
-        # Raw odom state
-        self.odom_x = 0.0
-        self.odom_y = 0.0
-        self.odom_yaw = 0.0
+        # Reused for every /cmd_vel publish; lock because nav, HTTP and
+        # collection threads all call send_velocity()
+        self._clock = self.get_clock()
+        self._twist_msg = TwistStamped()
+        self._twist_msg.header.frame_id = 'base_link'
+        self._twist_lock = threading.Lock()
+
+        # Manual /cmd_vel POSTs only record the latest command; a 20Hz
+        # timer publishes it, so bursts of requests cost one publish
+        self._pending_cmd = (0.0, 0.0)
+        self._cmd_dirty = False
+        self._cmd_lock = threading.Lock()
+        self._cmd_timer = self.create_timer(CMD_VEL_PERIOD, self._publish_pending_cmd)
+
+        # Raw odom state — flat (x, y, yaw) doubles, replaced by one slice
+        # assignment per message so unpacking it is a consistent snapshot
+        self.odom_pose = array('d', [0.0, 0.0, 0.0])
+        # (quaternion, yaw) of the last odom message — the orientation is
+        # often unchanged between messages (idle, straight driving)
+        self._yaw_cache = ((1.0, 0.0, 0.0, 0.0), 0.0)
         self.odom_received = False
         self.odom_count = 0
 
@@ -115,6 +151,12 @@ class ConeBridgeNode(Node):
         self.waypoint_state = 'idle'      # idle | calibrating | navigating | dwelling | completed
         self.dwell_remaining = 0.0
 
+        # Timer-driven go-to-point controller (see start_navigation)
+        self._nav_lock = threading.Lock()
+        self._nav_timer = None
+        self._nav_future = None
+        self._nav_closed = False    # set at shutdown; no new nav timers
+
         # Cone chase subprocess state
         self.cone_chase_process = None
         self.cone_chase_status_file = '/tmp/cone_chaser_status.json'
@@ -135,23 +177,36 @@ class ConeBridgeNode(Node):
         self.collection_status = {}    # exposed via /status
         self.collection_frame = None   # annotated JPEG for /camera
 
+        # Cached EV3 status so /status polls don't each block on the EV3
+        self._ev3_status_cache = None
+        self._ev3_status_time = 0.0
+        self._ev3_status_lock = threading.Lock()
+
+        # Each sensor gets its own mutually exclusive group: the
+        # multi-threaded executor runs /odom and /uwb alongside the timers
+        # and each other, but never two callbacks of the same topic at once
         self.odom_sub = self.create_subscription(
-            Odometry, '/odom', self.odom_callback, 10
+            Odometry, '/odom', self.odom_callback, 10,
+            callback_group=MutuallyExclusiveCallbackGroup(),
         )
         self.uwb_sub = self.create_subscription(
-            PoseStamped, '/uwb/pose', self.uwb_callback, 10
+            PoseStamped, '/uwb/pose', self.uwb_callback, 10,
+            callback_group=MutuallyExclusiveCallbackGroup(),
         )
         self.get_logger().info(f'ConeBridge running on port {PORT}')
 
     def odom_callback(self, msg):
-        pos = msg.pose.pose.position
-        ori = msg.pose.pose.orientation
-        siny = 2.0 * (ori.w * ori.z + ori.x * ori.y)
-        cosy = 1.0 - 2.0 * (ori.y * ori.y + ori.z * ori.z)
-        prev_x, prev_y = self.odom_x, self.odom_y
-        self.odom_x = pos.x
-        self.odom_y = pos.y
-        self.odom_yaw = math.atan2(siny, cosy)
+        pose = msg.pose.pose
+        pos = pose.position
+        ori = pose.orientation
+        quat = (ori.w, ori.x, ori.y, ori.z)
+        cached_quat, yaw = self._yaw_cache
+        if quat != cached_quat:
+            w, x, y, z = quat
+            yaw = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+            self._yaw_cache = (quat, yaw)
+        prev_x, prev_y, _ = self.odom_pose
+        self.odom_pose[:] = array('d', (pos.x, pos.y, yaw))
         self.odom_count += 1
         if not self.odom_received:
             self.odom_received = True
@@ -180,18 +235,31 @@ class ConeBridgeNode(Node):
                 f'[UWB] First UWB: ({self.uwb_x:.4f}, {self.uwb_y:.4f})'
             )
 
+    @property
+    def odom_x(self):
+        return self.odom_pose[ODOM_X]
+
+    @property
+    def odom_y(self):
+        return self.odom_pose[ODOM_Y]
+
+    @property
+    def odom_yaw(self):
+        return self.odom_pose[ODOM_YAW]
+
     # ── Fusion methods ────────────────────────────────────────────
 
     def get_fused_position(self):
         """UWB anchor + rotated odom delta = fused world position."""
+        odom_x, odom_y, _ = self.odom_pose
         if self.anchor_x is None or self.odom_anchor_x is None:
             # Not yet anchored — fall back to raw UWB or odom
             if self.uwb_x is not None:
                 return self.uwb_x, self.uwb_y
-            return self.odom_x, self.odom_y
+            return odom_x, odom_y
 
-        dx = self.odom_x - self.odom_anchor_x
-        dy = self.odom_y - self.odom_anchor_y
+        dx = odom_x - self.odom_anchor_x
+        dy = odom_y - self.odom_anchor_y
 
         if self.yaw_offset is not None:
             cos_y = math.cos(self.yaw_offset)
@@ -216,8 +284,7 @@ class ConeBridgeNode(Node):
             return
         self.anchor_x = self.uwb_x
         self.anchor_y = self.uwb_y
-        self.odom_anchor_x = self.odom_x
-        self.odom_anchor_y = self.odom_y
+        self.odom_anchor_x, self.odom_anchor_y, _ = self.odom_pose
         self.get_logger().info(
             f'Re-anchored: UWB=({self.anchor_x:.2f}, {self.anchor_y:.2f}), '
             f'odom=({self.odom_anchor_x:.2f}, {self.odom_anchor_y:.2f})'
@@ -253,8 +320,7 @@ class ConeBridgeNode(Node):
         # Set initial anchor
         self.anchor_x = self.uwb_x
         self.anchor_y = self.uwb_y
-        self.odom_anchor_x = self.odom_x
-        self.odom_anchor_y = self.odom_y
+        self.odom_anchor_x, self.odom_anchor_y, _ = self.odom_pose
 
         # Drive forward until UWB shows we've moved enough
         while not self.cancel_nav:
@@ -291,12 +357,27 @@ class ConeBridgeNode(Node):
     # ── Motion primitives ─────────────────────────────────────────
 
     def send_velocity(self, linear, angular):
-        msg = TwistStamped()
-        msg.header.stamp = self.get_clock().now().to_msg()
-        msg.header.frame_id = 'base_link'
-        msg.twist.linear.x = float(linear)
-        msg.twist.angular.z = float(angular)
-        self.cmd_vel_pub.publish(msg)
+        with self._twist_lock:
+            msg = self._twist_msg
+            msg.header.stamp = self._clock.now().to_msg()
+            msg.twist.linear.x = float(linear)
+            msg.twist.angular.z = float(angular)
+            self.cmd_vel_pub.publish(msg)
+
+    def queue_velocity(self, linear, angular):
+        """Record a manual velocity command for the next _publish_pending_cmd tick."""
+        with self._cmd_lock:
+            self._pending_cmd = (float(linear), float(angular))
+            self._cmd_dirty = True
+
+    def _publish_pending_cmd(self):
+        # Publish under _cmd_lock so a concurrent stop() can't slip its
+        # zero in between our read and publish and then be overwritten
+        with self._cmd_lock:
+            if not self._cmd_dirty:
+                return
+            self._cmd_dirty = False
+            self.send_velocity(*self._pending_cmd)
 
     def beep(self, sound_id=4):
         """Publish a beep to the TurtleBot3 buzzer.
@@ -309,18 +390,23 @@ class ConeBridgeNode(Node):
         self.cancel_nav = True
         self.collection_cancel = True
         self.collecting = False
-        self.send_velocity(0.0, 0.0)
+        # Resolve any active navigation here rather than waiting for the
+        # next _nav_tick, so navigate_to() callers return even if the
+        # executor has stopped spinning
+        with self._nav_lock:
+            if self._nav_timer is not None:
+                self._finish_navigation(False)
+        with self._cmd_lock:
+            self._cmd_dirty = False   # drop any queued manual command
+            self.send_velocity(0.0, 0.0)
         self.navigating = False
         self.calibrating = False
         self.waypoint_state = 'idle'
         self.dwell_remaining = 0.0
 
     def normalize_angle(self, angle):
-        while angle > math.pi:
-            angle -= 2.0 * math.pi
-        while angle < -math.pi:
-            angle += 2.0 * math.pi
-        return angle
+        # IEEE remainder wraps into [-pi, pi] in one step, no loops
+        return math.remainder(angle, math.tau)
 
     # ── Navigation (uses fused position) ──────────────────────────
 
@@ -352,13 +438,18 @@ class ConeBridgeNode(Node):
         """Proportional go-to-point using UWB+odom fused position.
         If reverse=True, robot backs into the goal (front faces away).
         If obstacle_avoidance=False, skip ultrasonic avoidance (still respects boundaries).
-        If timeout is set (seconds), stops and returns False if goal not reached in time."""
-        self.navigating = True
-        self.cancel_nav = False
-        rate = 0.05  # 20Hz
-        loop_count = 0
+        If timeout is set (seconds), stops and returns False if goal not reached in time.
+        Blocks until the timer-driven controller finishes; returns True if reached."""
+        return self.start_navigation(
+            goal_x, goal_y, reverse=reverse,
+            obstacle_avoidance=obstacle_avoidance, timeout=timeout,
+        ).result()
+
+    def start_navigation(self, goal_x, goal_y, reverse=False, obstacle_avoidance=True, timeout=None):
+        """Start the 20Hz navigation timer and return immediately.
+        Returns a Future resolved with True (reached) or False (cancelled/timeout).
+        Any navigation already in progress is cancelled first."""
         start_time = time.time()
-
         nav_mode = 'REVERSE' if reverse else 'FORWARD'
         self.get_logger().info(
             f'[NAV] ── Starting {nav_mode} navigation to ({goal_x:.3f}, {goal_y:.3f}) ──'
@@ -400,9 +491,47 @@ class ConeBridgeNode(Node):
             f'initial dist to goal: {init_dist:.3f}m'
         )
 
-        odom_at_start = (self.odom_x, self.odom_y, self.odom_count)
+        with self._nav_lock:
+            if self._nav_closed:
+                # Executor is gone — a new timer would never tick
+                future = Future()
+                future.set_result(False)
+                return future
+            if self._nav_timer is not None:
+                self._finish_navigation(False)
+
+            self.navigating = True
+            self.cancel_nav = False
+            self._nav_goal = (goal_x, goal_y)
+            self._nav_reverse = reverse
+            self._nav_obstacle_avoidance = obstacle_avoidance
+            self._nav_timeout = timeout
+            self._nav_mode = nav_mode
+            self._nav_start_time = start_time
+            self._nav_loop_count = 0
+            self._nav_odom_at_start = (self.odom_x, self.odom_y, self.odom_count)
+            self._nav_future = Future()
+            self._nav_timer = self.create_timer(NAV_RATE, self._nav_tick)
+            return self._nav_future
+
+    def _nav_tick(self):
+        """One controller iteration — runs on the executor via the nav timer."""
+        with self._nav_lock:
+            if self._nav_timer is None:
+                return
+            if self.cancel_nav:
+                self._finish_navigation(False)
+                return
+
+            goal_x, goal_y = self._nav_goal
+            reverse = self._nav_reverse
+            obstacle_avoidance = self._nav_obstacle_avoidance
+            timeout = self._nav_timeout
+            nav_mode = self._nav_mode
+            start_time = self._nav_start_time
+            loop_count = self._nav_loop_count
+            odom_at_start = self._nav_odom_at_start
 
-        while not self.cancel_nav:
             fx, fy = self.get_fused_position()
             heading = self.get_fused_heading()
 
@@ -445,15 +574,13 @@ class ConeBridgeNode(Node):
             }
 
             if dist < GOAL_TOLERANCE:
-                self.send_velocity(0.0, 0.0)
                 self.get_logger().info(
                     f'[NAV] ✓ Reached ({goal_x:.2f}, {goal_y:.2f}) via {nav_mode}, '
                     f'error: {dist:.3f}m, loops: {loop_count}, '
                     f'time: {time.time() - start_time:.1f}s'
                 )
-                self.nav_debug = {}
-                self.navigating = False
-                return True
+                self._finish_navigation(True)
+                return
 
             if abs(angle_error) > ANGLE_TOLERANCE and oa_state == 'clear':
                 # Normal turning toward goal — no obstacle interference
@@ -503,21 +630,38 @@ class ConeBridgeNode(Node):
                     f'odom_moved={odom_delta:.4f}m'
                 )
 
-            loop_count += 1
+            self._nav_loop_count = loop_count + 1
             if timeout is not None and (time.time() - start_time) >= timeout:
                 self.get_logger().warn(
                     f'[NAV] Timeout after {timeout:.0f}s — stopping navigation to ({goal_x:.2f}, {goal_y:.2f})'
                 )
-                break
-            time.sleep(rate)
+                self._finish_navigation(False)
 
+    def close_navigation(self):
+        """Cancel any active navigation and refuse new ones. Called at
+        shutdown so nav worker tasks blocked in navigate_to() return
+        instead of keeping the process alive."""
+        self.cancel_nav = True
+        with self._nav_lock:
+            self._nav_closed = True
+            if self._nav_timer is not None:
+                self._finish_navigation(False)
+
+    def _finish_navigation(self, reached):
+        """Stop the robot, tear down the nav timer and resolve its Future.
+        Caller must hold _nav_lock."""
         self.send_velocity(0.0, 0.0)
-        self.get_logger().info(
-            f'[NAV] ✗ Cancelled after {loop_count} loops, {time.time() - start_time:.1f}s'
-        )
+        if not reached:
+            self.get_logger().info(
+                f'[NAV] ✗ Cancelled after {self._nav_loop_count} loops, '
+                f'{time.time() - self._nav_start_time:.1f}s'
+            )
+        self._nav_timer.cancel()
+        self.destroy_timer(self._nav_timer)
+        self._nav_timer = None
         self.nav_debug = {}
         self.navigating = False
-        return False
+        self._nav_future.set_result(reached)
 
     # ── Cone chase helpers ──────────────────────────────────────────
 
@@ -602,6 +746,22 @@ class ConeBridgeNode(Node):
             self.get_logger().warn(f'[EV3] Status check failed: {e}')
             return None
 
+    def ev3_status_cached(self):
+        """EV3 status for /status polls. Probes the EV3 at most once per
+        EV3_STATUS_CACHE_SEC; while a probe is in flight (up to 2s with the
+        EV3 offline) other pollers get the stale value instead of waiting."""
+        if time.time() - self._ev3_status_time < EV3_STATUS_CACHE_SEC:
+            return self._ev3_status_cache
+        if not self._ev3_status_lock.acquire(blocking=False):
+            return self._ev3_status_cache
+        try:
+            if time.time() - self._ev3_status_time >= EV3_STATUS_CACHE_SEC:
+                self._ev3_status_cache = self.ev3_status()
+                self._ev3_status_time = time.time()
+            return self._ev3_status_cache
+        finally:
+            self._ev3_status_lock.release()
+
     def get_obstacle_avoidance(self, heading, goal_angle):
         """Reactive obstacle avoidance — steers AROUND obstacles, never just stops.
         Only reacts to sensors that are relevant to the current direction of travel.
@@ -1137,45 +1297,78 @@ class ConeBridgeNode(Node):
         if self.uwb_x is not None:
             return {'x': self.uwb_x, 'y': self.uwb_y, 'theta': self.get_fused_heading()}
 
-        return {'x': self.odom_x, 'y': self.odom_y, 'theta': self.odom_yaw}
+        x, y, theta = self.odom_pose
+        return {'x': x, 'y': y, 'theta': theta}
 
 
 bridge_node: ConeBridgeNode = None
 
+# /navigate (first-run calibration) and /waypoints run one task at a time
+# on a single worker; new requests are rejected while one is in flight.
+nav_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='nav')
+nav_task = None
+nav_task_lock = threading.Lock()
+
+
+def nav_task_active():
+    return nav_task is not None and not nav_task.done()
+
+
+def _report_nav_task(future):
+    exc = future.exception()
+    if exc is not None:
+        bridge_node.get_logger().error(f'Navigation task failed: {exc!r}')
+
+
+def submit_nav_task(fn):
+    """Run fn on the navigation worker. Returns False if a task is already running."""
+    global nav_task
+    with nav_task_lock:
+        if nav_task_active():
+            return False
+        nav_task = nav_exec.submit(fn)
+        nav_task.add_done_callback(_report_nav_task)
+        return True
+
 
 class Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keep-alive so pollers and the WASD client reuse one socket;
+    # every non-streaming response therefore sends Content-Length.
+    protocol_version = 'HTTP/1.1'
+
     def _cors_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
 
     def _json_response(self, data, status=200):
+        body = json_dumps(data)
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self._cors_headers()
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
     def _read_body(self):
         length = int(self.headers.get('Content-Length', 0))
         if length == 0:
             return {}
-        return json.loads(self.rfile.read(length))
+        return json_loads(self.rfile.read(length))
 
     def do_OPTIONS(self):
         self.send_response(204)
+        self.send_header('Content-Length', '0')
         self._cors_headers()
         self.end_headers()
 
     def do_GET(self):
         if self.path == '/odom':
-            self._json_response({
-                'x': bridge_node.odom_x,
-                'y': bridge_node.odom_y,
-                'theta': bridge_node.odom_yaw,
-            })
+            odom_x, odom_y, odom_yaw = bridge_node.odom_pose
+            self._json_response({'x': odom_x, 'y': odom_y, 'theta': odom_yaw})
         elif self.path == '/status':
             pose = bridge_node.get_display_pose()
+            odom_x, odom_y, odom_yaw = bridge_node.odom_pose
             chase_active = bridge_node.cone_chase_active
             chase_status = bridge_node.read_cone_chase_status() if chase_active else None
             self._json_response({
@@ -1187,11 +1380,7 @@ class Handler(BaseHTTPRequestHandler):
                     'x': bridge_node.uwb_x,
                     'y': bridge_node.uwb_y,
                 } if bridge_node.uwb_x is not None else None,
-                'odom_pose': {
-                    'x': bridge_node.odom_x,
-                    'y': bridge_node.odom_y,
-                    'theta': bridge_node.odom_yaw,
-                },
+                'odom_pose': {'x': odom_x, 'y': odom_y, 'theta': odom_yaw},
                 'waypoint_index': bridge_node.waypoint_index,
                 'waypoint_total': bridge_node.waypoint_total,
                 'waypoint_state': bridge_node.waypoint_state,
@@ -1205,13 +1394,14 @@ class Handler(BaseHTTPRequestHandler):
                 'nav_debug': bridge_node.nav_debug if bridge_node.navigating else None,
                 'odom_count': bridge_node.odom_count,
                 'uwb_count': bridge_node.uwb_count,
-                'ev3_mechanism': bridge_node.ev3_status(),
+                'ev3_mechanism': bridge_node.ev3_status_cached(),
             })
         elif self.path == '/camera':
             # If collection is running, serve its annotated frames
             if bridge_node.collecting:
                 self.send_response(200)
                 self.send_header('Content-Type', 'multipart/x-mixed-replace; boundary=frame')
+                self.send_header('Connection', 'close')  # stream ends on close
                 self._cors_headers()
                 self.end_headers()
                 try:
@@ -1231,6 +1421,7 @@ class Handler(BaseHTTPRequestHandler):
             if bridge_node.lock_on_running:
                 self.send_response(200)
                 self.send_header('Content-Type', 'multipart/x-mixed-replace; boundary=frame')
+                self.send_header('Connection', 'close')  # stream ends on close
                 self._cors_headers()
                 self.end_headers()
                 try:
@@ -1266,6 +1457,7 @@ class Handler(BaseHTTPRequestHandler):
 
             self.send_response(200)
             self.send_header('Content-Type', 'multipart/x-mixed-replace; boundary=frame')
+            self.send_header('Connection', 'close')  # stream ends on close
             self._cors_headers()
             self.end_headers()
 
@@ -1311,7 +1503,7 @@ class Handler(BaseHTTPRequestHandler):
             if bridge_node.lock_on_running:
                 self._json_response({'error': 'lock-on active'}, 409)
                 return
-            bridge_node.send_velocity(
+            bridge_node.queue_velocity(
                 body.get('linear', 0.0),
                 body.get('angular', 0.0),
             )
@@ -1342,15 +1534,24 @@ class Handler(BaseHTTPRequestHandler):
             x = body.get('x', 0.0)
             y = body.get('y', 0.0)
 
-            def nav():
-                # Auto-calibrate on first navigation
-                if not bridge_node.calibrated:
+            if bridge_node.calibrated:
+                if nav_task_active():
+                    self._json_response({'error': 'navigation task active'}, 409)
+                    return
+                # Controller runs on the nav timer — nothing to wait on here
+                bridge_node.re_anchor()
+                bridge_node.start_navigation(x, y, obstacle_avoidance=False)
+            else:
+                def nav():
+                    # Auto-calibrate on first navigation (blocking drive)
                     if not bridge_node.calibrate():
                         return
-                bridge_node.re_anchor()
-                bridge_node.navigate_to(x, y, obstacle_avoidance=False)
+                    bridge_node.re_anchor()
+                    bridge_node.start_navigation(x, y, obstacle_avoidance=False)
 
-            threading.Thread(target=nav, daemon=True).start()
+                if not submit_nav_task(nav):
+                    self._json_response({'error': 'navigation task active'}, 409)
+                    return
             self._json_response({'ok': True, 'msg': 'navigation started'})
 
         elif self.path == '/waypoints':
@@ -1522,7 +1723,9 @@ class Handler(BaseHTTPRequestHandler):
                 bridge_node.dwell_remaining = 0.0
                 bridge_node.get_logger().info('Waypoint sequence complete')
 
-            threading.Thread(target=run_waypoints, daemon=True).start()
+            if not submit_nav_task(run_waypoints):
+                self._json_response({'error': 'navigation task active'}, 409)
+                return
             self._json_response({
                 'ok': True,
                 'msg': f'executing {len(waypoints)} waypoints',
@@ -1622,12 +1825,12 @@ def main():
     rclpy.init()
     bridge_node = ConeBridgeNode()
 
-    spin_thread = threading.Thread(
-        target=lambda: rclpy.spin(bridge_node), daemon=True
-    )
+    executor = MultiThreadedExecutor(num_threads=2)
+    executor.add_node(bridge_node)
+    spin_thread = threading.Thread(target=executor.spin, daemon=True)
     spin_thread.start()
 
-    server = ThreadedHTTPServer(('0.0.0.0', PORT), Handler)
+    server = ThreadingHTTPServer(('0.0.0.0', PORT), Handler)
     print(f'ConeBridge HTTP server listening on port {PORT}')
     print(f'Endpoints:')
     print(f'  GET  /status           - connection status + fused pose')
@@ -1656,6 +1859,9 @@ def main():
         if bridge_node.collecting:
             bridge_node.collection_cancel = True
         bridge_node.stop()
+        bridge_node.close_navigation()
+        nav_exec.shutdown(wait=False, cancel_futures=True)
+        executor.shutdown()
         bridge_node.destroy_node()
         rclpy.shutdown()
 
@@ -18,6 +18,8 @@ import cv2
 import numpy as np
 import json
 import os
+import threading
+from fractions import Fraction
 
 # ── Cone physical dimensions (mm) ──────────────────────────────────────
 KNOWN_WIDTH_MM = 196.0   # cone diameter in mm
@@ -27,6 +29,7 @@ KNOWN_HEIGHT_MM = 50.0   # cone height in mm
 CAMERA_DFOV_DEG = 55.0   # diagonal field of view in degrees
 FRAME_WIDTH = 640
 FRAME_HEIGHT = 480
+DETECT_DOWNSCALE = 2     # main() detects on a half-size frame (4x fewer pixels)
 
 # ── Calibration override (optional) ───────────────────────────────────
 CALIBRATION_DISTANCE_MM = 500.0  # for manual fine-tune: place cone at 50cm
@@ -39,6 +42,12 @@ RED_UPPER_1 = np.array([12, 255, 255])
 RED_LOWER_2 = np.array([155, 110, 80])
 RED_UPPER_2 = np.array([180, 255, 255])
 
+# Same two ranges after rotating hue by +90 (mod 180): red becomes one
+# contiguous band (155..179 -> 65..89, 0..12 -> 90..102), one inRange.
+RED_HUE_SHIFT = 90
+RED_LOWER_ROT = np.array([RED_LOWER_2[0] + RED_HUE_SHIFT - 180, 110, 80])
+RED_UPPER_ROT = np.array([RED_UPPER_1[0] + RED_HUE_SHIFT, 255, 255])
+
 # ── BGR channel ratio — red cone must have R dominate G and B ─────────
 # This is the strongest false-positive killer: skin (R~G), brown (R~G~B),
 # warm walls, wood, etc. all fail because their R channel doesn't dominate.
@@ -73,59 +82,246 @@ def save_calibration(focal_length):
     print(f"[OK] Calibration saved: focal_length = {focal_length:.1f} px")
 
 
-def detect_red_cones(frame):
+def build_red_mask_lut():
+    """Precompute the two-stage red colour filter for every BGR triplet.
+
+    Returns a (256, 256, 256) uint8 table indexed as lut[b, g, r] that is
+    255 where the pixel passes both the HSV range and the BGR ratio test.
+    Both stages are pure per-pixel functions of BGR, so a frame's mask
+    becomes a single gather instead of cvtColor + 2x inRange + ratio math.
+    Filled one B-plane at a time so temporaries stay at 256x256 pixels.
+    """
+    levels = np.arange(256, dtype=np.uint8)
+    lut = np.empty((256, 256, 256), dtype=np.uint8)
+
+    # Stage 2 (BGR channel ratio) is separable into (g, r) and (b, r)
+    c_f = levels.astype(np.float32) + 1.0   # +1 avoids division by zero
+    rg_ok = c_f[None, :] / c_f[:, None] > RED_RATIO_RG   # [g, r]
+    rb_ok = c_f[None, :] / c_f[:, None] > RED_RATIO_RB   # [b, r]
+
+    plane = np.empty((256, 256, 3), dtype=np.uint8)
+    plane[..., 1] = levels[:, None]
+    plane[..., 2] = levels[None, :]
+    for b in range(256):
+        plane[..., 0] = b
+        # ── Stage 1: HSV mask over this plane's 2^16 colours ──────────
+        hsv = cv2.cvtColor(plane, cv2.COLOR_BGR2HSV)
+        hue = hsv[..., 0]
+        hue[...] = (hue.astype(np.uint16) + RED_HUE_SHIFT) % 180
+        cv2.inRange(hsv, RED_LOWER_ROT, RED_UPPER_ROT, dst=lut[b])
+        lut[b][~(rb_ok[b][None, :] & rg_ok)] = 0
+    return lut
+
+
+# ~16 MB, built on the first detect_red_cones call so modules that only
+# import helpers from here (cone_bridge, cone_chaser) don't pay for it.
+_red_mask_lut = None
+_red_mask_lut_lock = threading.Lock()
+
+
+def get_red_mask_lut():
+    """Return the shared red-mask LUT, building it on first use."""
+    global _red_mask_lut
+    if _red_mask_lut is None:
+        with _red_mask_lut_lock:
+            if _red_mask_lut is None:
+                _red_mask_lut = build_red_mask_lut()
+    return _red_mask_lut
+
+
+def _cuda_available():
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+# Jetson-class boards with a CUDA-enabled OpenCV run the per-pixel stages
+# on the GPU (see _red_mask_cuda); everything else uses the CPU path.
+USE_CUDA = _cuda_available()
+
+
+# Per-thread scratch buffers for detect_red_cones, keyed by input shape
+# and downscale, so the vision loop reuses the same pages every frame.
+_detect_workspace = threading.local()
+
+
+def _get_workspace(full_h, full_w, s):
+    cache = getattr(_detect_workspace, "bufs", None)
+    if cache is None:
+        cache = _detect_workspace.bufs = {}
+    ws = cache.get((full_h, full_w, s))
+    if ws is None:
+        h, w = full_h // s, full_w // s
+        ws = cache[(full_h, full_w, s)] = {
+            "small": np.empty((h, w, 3), np.uint8) if s > 1 else None,
+            "blurred": np.empty((h, w, 3), np.uint8),
+            "idx": np.empty((h, w), np.intp),
+            "mask": np.empty((h, w), np.uint8),
+            "scratch": np.empty(h * w, np.uint8),   # flat; viewed per ROI
+        }
+    return ws
+
+
+def _red_mask_cpu(frame, s, ws, k_close, k_open):
+    """Resize → blur → colour mask → close/open, writing into ws buffers."""
+    full_h, full_w = frame.shape[:2]
+    if s > 1:
+        frame = cv2.resize(frame, (full_w // s, full_h // s), dst=ws["small"],
+                           interpolation=cv2.INTER_AREA)
+
+    blurred = cv2.GaussianBlur(frame, (5, 5), 0, dst=ws["blurred"])
+
+    # ── Colour mask: one LUT gather, no HSV intermediate ──────────────
+    # Flat index b<<16 | g<<8 | r; take() on the 3-D table indexes it flat.
+    idx = ws["idx"]
+    idx[...] = blurred[..., 0]
+    idx <<= 8
+    idx |= blurred[..., 1]
+    idx <<= 8
+    idx |= blurred[..., 2]
+    mask = get_red_mask_lut().take(idx, out=ws["mask"])
+
+    # ── Morphological cleanup ─────────────────────────────────────────
+    kernel_close = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k_close, k_close))
+    kernel_open = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k_open, k_open))
+
+    # Close+open can only change pixels within reach of a red pixel, so
+    # run them on the mask's bounding box padded by that reach. Output is
+    # identical to full-frame morphology; empty masks skip it entirely.
+    r_close, r_open = k_close // 2, k_open // 2
+    pad = max(2 * r_close, r_close + 2 * r_open)
+    bx, by, bw, bh = cv2.boundingRect(mask)
+    if bw > 0:
+        mask_h, mask_w = mask.shape
+        x0, y0 = max(0, bx - pad), max(0, by - pad)
+        x1, y1 = min(mask_w, bx + bw + pad), min(mask_h, by + bh + pad)
+        roi = mask[y0:y1, x0:x1]
+        # Contiguous view over the scratch buffer so dst= works in place
+        work = ws["scratch"][:roi.size].reshape(roi.shape)
+        np.copyto(work, roi)
+        cv2.morphologyEx(work, cv2.MORPH_CLOSE, kernel_close, dst=work)
+        cv2.morphologyEx(work, cv2.MORPH_OPEN, kernel_open, dst=work)
+        roi[...] = work
+    return mask
+
+
+def _ratio_coeffs(ratio):
+    """(d, n, d - n) such that (r+1)/(o+1) > ratio  <=>  d*r - n*o + (d-n) > 0."""
+    frac = Fraction(ratio).limit_denominator(100)
+    return frac.denominator, frac.numerator, frac.denominator - frac.numerator
+
+
+def _red_mask_cuda(frame, s, ws, k_close, k_open):
+    """GPU version of _red_mask_cpu; only the final mask is downloaded.
+
+    Same two-stage filter: HSV ranges via cuda.inRange, and the BGR ratio
+    tests as exact integer inequalities (addWeighted into saturating
+    uint8, so > 0 means pass). Returns None — and disables the CUDA path
+    for the rest of the run — if the OpenCV build rejects any call.
+    """
+    global USE_CUDA
+    try:
+        cuda = ws.get("cuda")
+        if cuda is None:
+            # CUDA filters take 1- or 4-channel 8-bit images
+            cuda = ws["cuda"] = {
+                "blur": cv2.cuda.createGaussianFilter(
+                    cv2.CV_8UC4, cv2.CV_8UC4, (5, 5), 0),
+                "close": cv2.cuda.createMorphologyFilter(
+                    cv2.MORPH_CLOSE, cv2.CV_8UC1,
+                    cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k_close, k_close))),
+                "open": cv2.cuda.createMorphologyFilter(
+                    cv2.MORPH_OPEN, cv2.CV_8UC1,
+                    cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k_open, k_open))),
+                "frame": cv2.cuda_GpuMat(),
+            }
+
+        gpu = cuda["frame"]
+        gpu.upload(frame)
+        if s > 1:
+            full_h, full_w = frame.shape[:2]
+            gpu = cv2.cuda.resize(gpu, (full_w // s, full_h // s),
+                                  interpolation=cv2.INTER_AREA)
+        blurred = cuda["blur"].apply(cv2.cuda.cvtColor(gpu, cv2.COLOR_BGR2BGRA))
+
+        # ── Stage 1: HSV mask ─────────────────────────────────────────
+        hsv = cv2.cuda.cvtColor(blurred, cv2.COLOR_BGRA2BGR)
+        hsv = cv2.cuda.cvtColor(hsv, cv2.COLOR_BGR2HSV)
+        mask = cv2.cuda.bitwise_or(
+            cv2.cuda.inRange(hsv, tuple(int(v) for v in RED_LOWER_1),
+                             tuple(int(v) for v in RED_UPPER_1)),
+            cv2.cuda.inRange(hsv, tuple(int(v) for v in RED_LOWER_2),
+                             tuple(int(v) for v in RED_UPPER_2)))
+
+        # ── Stage 2: BGR channel ratio ────────────────────────────────
+        b, g, r, _ = cv2.cuda.split(blurred)
+        for other, ratio in ((g, RED_RATIO_RG), (b, RED_RATIO_RB)):
+            d, n, c = _ratio_coeffs(ratio)
+            passed = cv2.cuda.addWeighted(r, d, other, -n, c, dtype=cv2.CV_8U)
+            _, passed = cv2.cuda.threshold(passed, 0, 255, cv2.THRESH_BINARY)
+            mask = cv2.cuda.bitwise_and(mask, passed)
+
+        # ── Morphological cleanup ─────────────────────────────────────
+        mask = cuda["open"].apply(cuda["close"].apply(mask))
+        return mask.download(ws["mask"])
+    except (cv2.error, AttributeError, TypeError) as e:
+        print(f"[!!] CUDA detection unavailable, using CPU: {e}")
+        USE_CUDA = False
+        return None
+
+
+def detect_red_cones(frame, downscale=1, want_mask=True):
     """Detect red cone-shaped blobs.
 
     Returns (detections, rejected, mask) where each detection is
     (x, y, w, h, area, ellipse).
 
-    Two-stage color filter:
+    With downscale > 1 the frame is shrunk by that factor (INTER_AREA)
+    before any per-pixel work; boxes, areas and ellipses are scaled back
+    to full-frame coordinates, while the returned mask stays small.
+
+    The returned mask is a reused buffer: it is overwritten by the next
+    call from the same thread. Pass want_mask=False to get None instead
+    when the caller has no use for it.
+
+    Two-stage color filter (precomputed into the red-mask LUT):
       1. HSV mask — selects hue-red with high saturation/value.
       2. BGR ratio mask — requires R channel to dominate G and B.
          This kills skin, brown wood, warm walls, orange fabric, etc.
          that leak through HSV alone.
 
-    Then morphological cleanup + contour extraction.
+    Then morphological cleanup + contour extraction. The per-pixel stages
+    run on the GPU when USE_CUDA is set.
     """
-    blurred = cv2.GaussianBlur(frame, (5, 5), 0)
-
-    # ── Stage 1: HSV mask ─────────────────────────────────────────────
-    hsv = cv2.cvtColor(blurred, cv2.COLOR_BGR2HSV)
-    mask1 = cv2.inRange(hsv, RED_LOWER_1, RED_UPPER_1)
-    mask2 = cv2.inRange(hsv, RED_LOWER_2, RED_UPPER_2)
-    mask = mask1 | mask2
-
-    # ── Stage 2: BGR channel ratio ────────────────────────────────────
-    # On the blurred image, check that R dominates G and B.
-    b, g, r = cv2.split(blurred)
-    r_f = r.astype(np.float32) + 1.0   # +1 avoids division by zero
-    g_f = g.astype(np.float32) + 1.0
-    b_f = b.astype(np.float32) + 1.0
-    ratio_mask = (
-        (r_f / g_f > RED_RATIO_RG) &
-        (r_f / b_f > RED_RATIO_RB)
-    ).astype(np.uint8) * 255
-    mask = mask & ratio_mask
+    s = downscale
+    full_h, full_w = frame.shape[:2]
+    ws = _get_workspace(full_h, full_w, s)
 
-    # ── Morphological cleanup ─────────────────────────────────────────
     # Large close bridges gaps from white specular highlights on the cone
-    kernel_close = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (15, 15))
-    kernel_open = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (7, 7))
-    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel_close)
-    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel_open)
+    # (kernel sizes shrink with the frame, kept odd)
+    k_close = max(3, (15 // s) | 1)
+    k_open = max(3, (7 // s) | 1)
+
+    mask = None
+    if USE_CUDA:
+        mask = _red_mask_cuda(frame, s, ws, k_close, k_open)
+    if mask is None:
+        mask = _red_mask_cpu(frame, s, ws, k_close, k_open)
 
     contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
     detections = []
     rejected = []
-    frame_h, frame_w = frame.shape[:2]
+    min_area = MIN_CONTOUR_AREA / (s * s)
 
     for cnt in contours:
         area = cv2.contourArea(cnt)
-        if area < MIN_CONTOUR_AREA:
+        if area < min_area:
             continue
 
         x, y, w, h = cv2.boundingRect(cnt)
+        x, y, w, h = x * s, y * s, w * s, h * s
 
         # Solidity: contour area vs convex hull — reject spindly/noisy shapes
         hull = cv2.convexHull(cnt)
@@ -139,10 +335,13 @@ def detect_red_cones(frame):
         ellipse = None
         if len(cnt) >= MIN_ELLIPSE_PTS:
             ellipse = cv2.fitEllipse(cnt)
+            if s > 1:
+                (ecx, ecy), (ea, eb), angle = ellipse
+                ellipse = ((ecx * s, ecy * s), (ea * s, eb * s), angle)
 
-        detections.append((x, y, w, h, area, ellipse))
+        detections.append((x, y, w, h, area * s * s, ellipse))
 
-    return detections, rejected, mask
+    return detections, rejected, (mask if want_mask else None)
 
 
 def estimate_distance(x, y, w, h, focal_length, frame_w):
@@ -247,13 +446,81 @@ class DetectionSmoother:
         return result
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# Threaded capture — cap.read() blocks for a full frame period, so grab
+# on a background thread and let detection overlap the next capture.
+# ═══════════════════════════════════════════════════════════════════════
+
+class FrameGrabber:
+    """Reads camera frames on a background thread.
+
+    - Two-slot buffer: the grabber writes one slot while the consumer
+      holds the other, then flips.
+    - read() always returns the newest frame; any frames captured while
+      the consumer was busy are dropped.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.buf = [None, None]
+        self.idx = 0          # slot the grabber writes next
+        self.seq = 0          # frames grabbed so far
+        self.read_seq = 0     # seq of the last frame handed out
+        self.ok = True
+        self.running = False
+        self.cond = threading.Condition()
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+        return self
+
+    def _loop(self):
+        while self.running:
+            ret, frame = self.cap.read()
+            with self.cond:
+                if not ret:
+                    self.ok = False
+                    self.cond.notify_all()
+                    return
+                self.buf[self.idx] = frame
+                self.idx ^= 1
+                self.seq += 1
+                self.cond.notify_all()
+
+    def read(self):
+        """Wait for a frame newer than the last one returned.
+        Returns (ret, frame) like cap.read(). Blocks like cap.read() too —
+        slow first frames and auto-exposure stalls are waited out; ret is
+        False only once the grabber thread has failed or exited."""
+        with self.cond:
+            while self.seq == self.read_seq:
+                if not self.ok or not self.thread.is_alive():
+                    return False, None
+                # Wake periodically in case the thread died without notifying
+                self.cond.wait(1.0)
+            self.read_seq = self.seq
+            return True, self.buf[self.idx ^ 1]
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Drawing helpers
 # ═══════════════════════════════════════════════════════════════════════
 
-def draw_detections(frame, detections, rejected, focal_length):
-    """Draw bounding boxes and distance labels on frame."""
+def draw_detections(frame, detections, rejected, focal_length, distances=None):
+    """Draw bounding boxes and distance labels on frame.
+    distances: optional precomputed estimate_distance() results, one per detection."""
     frame_h, frame_w = frame.shape[:2]
+    if distances is None:
+        distances = [estimate_distance(x, y, w, h, focal_length, frame_w)
+                     for (x, y, w, h, _, _) in detections]
 
     # Draw rejected items in blue with reason
     for (x, y, w, h, reason) in rejected:
@@ -262,8 +529,7 @@ def draw_detections(frame, detections, rejected, focal_length):
                     cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 150, 0), 1)
 
     # Draw accepted cones with distance + ellipse outline
-    for (x, y, w, h, area, ellipse) in detections:
-        dist_mm, mode = estimate_distance(x, y, w, h, focal_length, frame_w)
+    for (x, y, w, h, area, ellipse), (dist_mm, mode) in zip(detections, distances):
         dist_cm = dist_mm / 10.0
         color = (0, 255, 0)  # green
 
@@ -283,19 +549,22 @@ def draw_detections(frame, detections, rejected, focal_length):
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
 
 
-def draw_path_overlay(frame, detections, focal_length):
-    """Draw the greedy nearest-neighbor path the robot would take (same as cone_chaser)."""
+def draw_path_overlay(frame, detections, focal_length, distances=None):
+    """Draw the greedy nearest-neighbor path the robot would take (same as cone_chaser).
+    distances: optional precomputed estimate_distance() results, one per detection."""
     if not detections:
         return
 
     frame_h, frame_w = frame.shape[:2]
+    if distances is None:
+        distances = [estimate_distance(x, y, w, h, focal_length, frame_w)
+                     for (x, y, w, h, _, _) in detections]
 
     # Build list of (center_x, center_y, distance_mm) for each detection
     cones = []
-    for (x, y, w, h, area, ellipse) in detections:
+    for (x, y, w, h, area, ellipse), (dist_mm, _) in zip(detections, distances):
         cx = x + w // 2
         cy = y + h // 2
-        dist_mm, _ = estimate_distance(x, y, w, h, focal_length, frame_w)
         cones.append((cx, cy, dist_mm))
 
     # Greedy nearest-neighbor from robot (bottom center of frame)
@@ -359,6 +628,15 @@ def draw_path_overlay(frame, detections, focal_length):
                 (10, bar_y + 14), cv2.FONT_HERSHEY_SIMPLEX, 0.4, PATH_COLOR, 1)
 
 
+def window_visible(name):
+    """True if the HighGUI window exists, i.e. the user hasn't closed it.
+    (GTK reports minimized windows as visible too.)"""
+    try:
+        return cv2.getWindowProperty(name, cv2.WND_PROP_VISIBLE) >= 1
+    except cv2.error:
+        return False
+
+
 def draw_status(frame, focal_length, detections, is_custom_cal):
     """Draw status bar at the top."""
     h, w = frame.shape[:2]
@@ -403,13 +681,16 @@ def main():
     show_mask = False
     show_path = True
 
+    grabber = FrameGrabber(cap).start()
+
     while True:
-        ret, frame = cap.read()
+        ret, frame = grabber.read()
         if not ret:
             print("Failed to read frame")
             break
 
-        raw_detections, rejected, mask = detect_red_cones(frame)
+        raw_detections, rejected, mask = detect_red_cones(
+            frame, downscale=DETECT_DOWNSCALE, want_mask=show_mask)
 
         # Temporal smoothing — anchors detections across frames
         detections = smoother.update(raw_detections)
@@ -417,15 +698,25 @@ def main():
         # Sort by area (largest = closest) for display priority
         detections.sort(key=lambda d: d[4], reverse=True)
 
-        draw_detections(frame, detections, rejected, focal_length)
+        # Pinhole distances once per frame, shared by both overlays
+        frame_w = frame.shape[1]
+        distances = [estimate_distance(x, y, w, h, focal_length, frame_w)
+                     for (x, y, w, h, _, _) in detections]
+
+        draw_detections(frame, detections, rejected, focal_length, distances)
         if show_path:
-            draw_path_overlay(frame, detections, focal_length)
+            draw_path_overlay(frame, detections, focal_length, distances)
         draw_status(frame, focal_length, detections, is_custom_cal)
 
         cv2.imshow("Cone Detector", frame)
 
+        # If the user closed the mask window, turn the mask off so the
+        # next 'm' reopens it instead of toggling an invisible window
         if show_mask:
-            cv2.imshow("Red Mask (debug)", mask)
+            if window_visible("Red Mask (debug)"):
+                cv2.imshow("Red Mask (debug)", mask)
+            else:
+                show_mask = False
 
         key = cv2.waitKey(1) & 0xFF
 
@@ -458,9 +749,12 @@ def main():
 
         elif key == ord("m"):
             show_mask = not show_mask
-            if not show_mask:
+            if show_mask:
+                cv2.namedWindow("Red Mask (debug)")
+            else:
                 cv2.destroyWindow("Red Mask (debug)")
 
+    grabber.stop()
     cap.release()
     cv2.destroyAllWindows()
 
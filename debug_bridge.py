@@ -9,11 +9,14 @@ Usage:
     python3 debug_bridge.py --wasd                   # jump straight to WASD control
 """
 
+import http.client
 import json
 import sys
 import time
+import urllib.parse
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 
 DEFAULT_URL = "http://172.20.10.3:8888"
 LINEAR_SPEED = 0.10   # m/s - gentle test speed
@@ -50,6 +53,62 @@ def http_post(url, body=None):
         return None, str(e)
 
 
+class KeepAliveClient:
+    """JSON GET/POST over one persistent HTTP/1.1 connection to the bridge.
+
+    Saves a TCP handshake per request in tight loops (WASD). Reconnects
+    and retries once if the bridge dropped the idle socket.
+    """
+
+    def __init__(self, base):
+        parts = urllib.parse.urlsplit(base)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.conn = None
+
+    def _request(self, method, path, body=None):
+        headers = {}
+        if body is not None:
+            body = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        error = None
+        for _ in range(2):
+            try:
+                if self.conn is None:
+                    self.conn = http.client.HTTPConnection(self.host, self.port, timeout=3)
+                self.conn.request(method, path, body=body, headers=headers)
+                resp = self.conn.getresponse()
+                return json.loads(resp.read()), resp.status
+            except TimeoutError as e:
+                self.close()
+                return None, str(e)
+            except (http.client.HTTPException, OSError) as e:
+                # Stale keep-alive socket — reconnect and retry once
+                self.close()
+                error = e
+            except Exception as e:
+                self.close()
+                return None, str(e)
+        return None, str(error)
+
+    def get(self, path):
+        return self._request("GET", path)
+
+    def post(self, path, body=None):
+        return self._request("POST", path, body or {})
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def http_get_many(urls):
+    """GET independent URLs concurrently; returns [(data, status), ...] in order."""
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        return list(pool.map(http_get, urls))
+
+
 def ok(msg):
     print(f"  [PASS] {msg}")
 
@@ -70,9 +129,9 @@ def header(title):
 
 # ── checks ──────────────────────────────────────────────────────────────────
 
-def check_bridge_reachable(base):
+def check_bridge_reachable(base, prefetched=None):
     header("1. Bridge Reachable")
-    data, status = http_get(f"{base}/status")
+    data, status = prefetched or http_get(f"{base}/status")
     if data is None:
         fail(f"Cannot reach {base}/status  ->  {status}")
         fail("Is cone_bridge.py running? Is the IP correct?")
@@ -85,9 +144,9 @@ def check_bridge_reachable(base):
     return True
 
 
-def check_odom_alive(base):
+def check_odom_alive(base, prefetched=None):
     header("2. Odometry Feed")
-    pose1, _ = http_get(f"{base}/odom")
+    pose1, _ = prefetched or http_get(f"{base}/odom")
     if pose1 is None:
         fail("Could not read /odom")
         return False
@@ -205,6 +264,7 @@ def wasd_control(base):
 
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
+    client = KeepAliveClient(base)
 
     keymap = {
         'w': (LINEAR_SPEED, 0.0),
@@ -218,7 +278,7 @@ def wasd_control(base):
         while True:
             ch = sys.stdin.read(1).lower()
             if ch == 'q':
-                http_post(f"{base}/stop")
+                client.post("/stop")
                 print("\r\nStopped. Exiting WASD mode.\r\n")
                 break
 
@@ -227,16 +287,16 @@ def wasd_control(base):
                 label = {'w': 'FWD', 's': 'REV', 'a': 'LEFT', 'd': 'RIGHT'}[ch]
 
                 # Send velocity
-                resp, _ = http_post(f"{base}/cmd_vel", {"linear": lin, "angular": ang})
+                resp, _ = client.post("/cmd_vel", {"linear": lin, "angular": ang})
                 if resp is None or not resp.get("ok"):
                     print(f"\r  [{label}] SEND FAILED\r\n")
                     continue
 
                 time.sleep(TEST_DURATION)
-                http_post(f"{base}/stop")
+                client.post("/stop")
 
                 # Read pose
-                pose, _ = http_get(f"{base}/odom")
+                pose, _ = client.get("/odom")
                 if pose:
                     print(
                         f"\r  [{label}]  x={pose['x']:.3f}  y={pose['y']:.3f}  "
@@ -246,9 +306,10 @@ def wasd_control(base):
                 else:
                     print(f"\r  [{label}]  sent ok, odom read failed\r\n", end="")
     except KeyboardInterrupt:
-        http_post(f"{base}/stop")
+        client.post("/stop")
         print("\r\nInterrupted. Stopped.\r\n")
     finally:
+        client.close()
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
@@ -274,13 +335,16 @@ def main():
     print(f"\nConePilot Debug Tool")
     print(f"Target: {base}\n")
 
+    # /status and the first /odom read don't depend on each other
+    status_resp, odom_resp = http_get_many([f"{base}/status", f"{base}/odom"])
+
     results = {}
-    results['bridge'] = check_bridge_reachable(base)
+    results['bridge'] = check_bridge_reachable(base, status_resp)
     if not results['bridge']:
         print("\n[ABORT] Bridge not reachable. Fix this first.\n")
         sys.exit(1)
 
-    results['odom'] = check_odom_alive(base)
+    results['odom'] = check_odom_alive(base, odom_resp)
     results['cmd_vel'] = check_cmd_vel(base)
     results['navigate'] = check_navigate(base)
 